@@ -8,5 +8,10 @@ hydrologic frequency analysis and hydraulic calculations.
 __VERSION__ = "0.7.0"
 
 from pearson3curve.data import Data
-from pearson3curve.curve import Curve
-from pearson3curve.fitting import get_moments, get_fitted_moments
+from pearson3curve.curve import Curve, get_curve_values
+from pearson3curve.fitting import (
+    get_moments,
+    get_fitted_moments,
+    get_fitted_moments_batch,
+    get_fitted_moments_bootstrap,
+)
@@ -1,11 +1,15 @@
 """The P-III distribution curve class."""
 
-from scipy.stats import pearson3  # type: ignore
+import numpy as np
+
+from pearson3curve import _p3
 
 
 class Curve:
     """The P-III distribution curve class."""
 
+    __slots__ = ("ex", "cv", "cs")
+
     def __init__(self, ex: float, cv: float, cs: float) -> None:
         """Initialize the P-III distribution curve from the moments.
 
@@ -22,32 +26,88 @@ class Curve:
         self.cv = cv
         self.cs = cs
 
-    def get_value_from_prob(self, prob: float) -> float:
+    def get_value_from_prob(self, prob: float | np.ndarray) -> float | np.ndarray:
         """Get the value from the probability.
 
         Parameters
         ----------
-        prob : float
-            The probability, from 0 to 1.
+        prob : float | np.ndarray
+            The probability, from 0 to 1. An array of probabilities will be
+            evaluated at once.
 
         Returns
         -------
-        float
-            The value. `nan` if the probability is out of the range from 0 to 1.
+        float | np.ndarray
+            The value, or the array of values if an array is given. `nan` if
+            the probability is out of the range from 0 to 1.
         """
-        return (pearson3.ppf(1 - prob, self.cs) * self.cv + 1) * self.ex
+        if isinstance(prob, (int, float)):
+            # A plain number skips the array conversion entirely.
+            return (_p3.ppf_scalar(1 - prob, self.cs) * self.cv + 1) * self.ex
+
+        p = np.asarray(prob)
+        value = (_p3.ppf(1 - p, self.cs) * self.cv + 1) * self.ex
+
+        if p.ndim == 0:
+            return float(value)
 
-    def get_prob_from_value(self, value: float) -> float:
+        return value
+
+    def get_prob_from_value(self, value: float | np.ndarray) -> float | np.ndarray:
         """Get the probability from the value.
 
         Parameters
         ----------
-        value : float
-            The value.
+        value : float | np.ndarray
+            The value. An array of values will be evaluated at once.
 
         Returns
         -------
-        float
-            The probability, from 0 to 1.
+        float | np.ndarray
+            The probability, from 0 to 1, or the array of probabilities if an
+            array is given.
         """
-        return 1 - pearson3.cdf((value / self.ex - 1) / self.cv, self.cs)
+        if isinstance(value, (int, float)):
+            return 1 - _p3.cdf_scalar((value / self.ex - 1) / self.cv, self.cs)
+
+        v = np.asarray(value)
+        prob = 1 - _p3.cdf((v / self.ex - 1) / self.cv, self.cs)
+
+        if v.ndim == 0:
+            return float(prob)
+
+        return prob
+
+
+def get_curve_values(
+    ex: float | np.ndarray,
+    cv: float | np.ndarray,
+    cs: float | np.ndarray,
+    prob: float | np.ndarray,
+) -> np.ndarray:
+    """Get the values of several P-III distribution curves from the
+    probabilities at once.
+
+    Parameters
+    ----------
+    ex : float | np.ndarray
+        The means of the curves.
+    cv : float | np.ndarray
+        The coefficients of variation of the curves.
+    cs : float | np.ndarray
+        The skewnesses of the curves.
+    prob : float | np.ndarray
+        The probabilities, from 0 to 1.
+
+    Returns
+    -------
+    np.ndarray
+        The values, with one row for each curve and one column for each
+        probability. `nan` if the probability is out of the range from 0 to 1.
+    """
+
+    # One row for each curve, broadcast against one column for each probability
+    ex, cv, cs = (np.reshape(m, (-1, 1)) for m in (ex, cv, cs))
+    prob = np.ravel(prob)
+
+    return (_p3.ppf(1 - prob, cs) * cv + 1) * ex
@@ -1,11 +1,37 @@
 """The P-III distributed data class."""
 
+from functools import lru_cache
+
 import numpy as np
 
 
+@lru_cache(maxsize=128)
+def _get_plotting_positions(l: int, n: int) -> np.ndarray:
+    """Get the Weibull plotting positions `m / (n + 1)` for `m` from 1 to `l`.
+
+    The positions only depend on the lengths, so they are shared by all the
+    data of the same size and must not be modified.
+    """
+
+    positions = np.arange(1, l + 1) / (n + 1)
+    positions.flags.writeable = False
+
+    return positions
+
+
 class Data:
     """The P-III distributed data class."""
 
+    __slots__ = (
+        "_observed_data",
+        "_data",
+        "_extreme_data",
+        "_ordinary_data",
+        "_period_length",
+        "_empirical_prob",
+        "_default_prob",
+    )
+
     def __init__(self, observed_data: list[float] | np.ndarray) -> None:
         """Initialize the P-III distributed data from the observed data.
 
@@ -15,17 +41,23 @@ class Data:
             The observed data, supporting either a list or a numpy array.
         """
 
-        if isinstance(observed_data, list):
-            self._observed_data = np.array(observed_data)
-        else:
-            self._observed_data = observed_data
+        # The observed data are kept sorted, so that the history data can be
+        # merged into them without sorting all over again. A contiguous
+        # descending array is faster to work on than a reversed view.
+        self._observed_data = np.ascontiguousarray(
+            np.sort(np.asarray(observed_data, dtype=np.float64))[::-1]
+        )
+        # The data and the views on it are shared with the callers of the
+        # properties, so they are read-only.
+        self._observed_data.flags.writeable = False
 
-        self._data = np.sort(self._observed_data)[::-1]
-        self._extreme_data = np.array([])
-        self._ordinary_data = self._data.copy()
+        self._data = self._observed_data
+        self._extreme_data = self._data[:0]
+        self._ordinary_data = self._data
         self._period_length = len(observed_data)
 
         self._empirical_prob: np.ndarray | None = None
+        self._default_prob: np.ndarray | None = None
 
     @property
     def data(self) -> np.ndarray:
@@ -34,7 +66,7 @@ class Data:
         Returns
         -------
         np.ndarray
-            The descending sorted data.
+            The descending sorted data (read-only).
         """
 
         return self._data
@@ -46,7 +78,7 @@ class Data:
         Returns
         -------
         np.ndarray
-            The descending sorted extreme data.
+            The descending sorted extreme data (read-only).
         """
 
         return self._extreme_data
@@ -58,7 +90,7 @@ class Data:
         Returns
         -------
         np.ndarray
-            The descending sorted ordinary data.
+            The descending sorted ordinary data (read-only).
         """
 
         return self._ordinary_data
@@ -82,7 +114,9 @@ class Data:
         *,
         extreme_num: int | None = None,
     ) -> None:
-        """Set the history data and the survey period length.
+        """Set the history data and the survey period length. The empirical
+        probabilities set before are discarded, since they no longer match the
+        data.
 
         Parameters
         ----------
@@ -120,9 +154,18 @@ lengths of the observed data and the history data."
 of the history data."
             )
 
-        self._data = np.sort(np.concatenate([self._observed_data, history_data]))[::-1]
+        # Sorting the negated data gives a contiguous descending array.
+        self._data = -np.sort(
+            -np.concatenate(
+                [self._observed_data, np.asarray(history_data, dtype=np.float64)]
+            )
+        )
+        self._data.flags.writeable = False
+
         self._extreme_data = self._data[:extreme_num]
         self._ordinary_data = self._data[extreme_num:]
+        self._empirical_prob = None
+        self._default_prob = None
 
     @property
     def extreme_prob(self) -> np.ndarray:
@@ -131,16 +174,10 @@ of the history data."
         Returns
         -------
         np.ndarray
-            The empirical probabilities for the extreme data.
+            The empirical probabilities for the extreme data (read-only).
         """
 
-        if self._empirical_prob is not None:
-            return self._empirical_prob[: len(self.extreme_data)]
-
-        if (l := len(self.extreme_data)) == 0:
-            return np.array([])
-
-        return (np.arange(l) + 1) / (self._period_length + 1)
+        return self.empirical_prob[: len(self.extreme_data)]
 
     @property
     def ordinary_prob(self) -> np.ndarray:
@@ -149,19 +186,10 @@ of the history data."
         Returns
         -------
         np.ndarray
-            The empirical probabilities for the ordinary data.
+            The empirical probabilities for the ordinary data (read-only).
         """
 
-        if self._empirical_prob is not None:
-            return self._empirical_prob[len(self.extreme_data) :]
-
-        if len(self.extreme_data) == 0:
-            return (np.arange(self._period_length) + 1) / (self._period_length + 1)
-
-        # The maximum empirical probability for the extreme data
-        mp = self.extreme_prob[-1]
-        l = len(self.ordinary_data)
-        return mp + (1 - mp) * (np.arange(l) + 1) / (l + 1)
+        return self.empirical_prob[len(self.extreme_data) :]
 
     @property
     def empirical_prob(self) -> np.ndarray:
@@ -170,13 +198,46 @@ of the history data."
         Returns
         -------
         np.ndarray
-            The empirical probabilities for the data.
+            The empirical probabilities for the data (read-only).
         """
 
         if self._empirical_prob is not None:
-            return self._empirical_prob
+            # The set probabilities are kept writable for updates by order, so
+            # they are exposed through a read-only view.
+            prob = self._empirical_prob.view()
+            prob.flags.writeable = False
+            return prob
+
+        if self._default_prob is None:
+            self._default_prob = self._get_default_prob()
+            # The cached probabilities are shared by every access.
+            self._default_prob.flags.writeable = False
+
+        return self._default_prob
+
+    def _get_default_prob(self) -> np.ndarray:
+        """Calculate the default empirical probabilities for the data.
 
-        return np.concatenate([self.extreme_prob, self.ordinary_prob])
+        Returns
+        -------
+        np.ndarray
+            The default empirical probabilities for the data.
+        """
+
+        if (l := len(self._extreme_data)) == 0:
+            return _get_plotting_positions(self._period_length, self._period_length)
+
+        # Fill both parts into a single array
+        prob = np.empty(l + len(self._ordinary_data))
+        prob[:l] = _get_plotting_positions(l, self._period_length)
+
+        # The maximum empirical probability for the extreme data, in closed form
+        mp = l / (self._period_length + 1)
+        n = len(prob) - l
+        np.multiply(_get_plotting_positions(n, n), 1 - mp, out=prob[l:])
+        prob[l:] += mp
+
+        return prob
 
     def set_empirical_prob(self, empirical_prob: list[float] | np.ndarray) -> None:
         """Set all the empirical probabilities for the data.
@@ -197,22 +258,22 @@ of the history data."
             from 0 to 1.
         """
 
+        # Keep a private copy, which may be modified in place later.
+        empirical_prob = np.array(empirical_prob, dtype=np.float64)
+
         if len(empirical_prob) != len(self.data):
             raise ValueError(
                 "The length of the empirical probabilities should be the same \
 as the survey period length."
             )
 
-        if any(p < 0 or p > 1 for p in empirical_prob):
+        if ((empirical_prob < 0) | (empirical_prob > 1)).any():
             raise ValueError(
                 "The values in the empirical probabilities should be in the \
 range from 0 to 1."
             )
 
-        if isinstance(empirical_prob, list):
-            self._empirical_prob = np.array(empirical_prob)
-        else:
-            self._empirical_prob = empirical_prob
+        self._empirical_prob = empirical_prob
 
     def set_empirical_prob_by_order(
         self, order: int, prob: float, *, start_value=1
@@ -246,7 +307,7 @@ range from 0 to 1."
         if prob < 0 or prob > 1:
             raise ValueError("The probability should be in the range from 0 to 1.")
 
-        ep = self.empirical_prob.copy()
-        self._empirical_prob = np.where(
-            np.arange(len(ep)) == order - start_value, prob, ep
-        )
+        if self._empirical_prob is None:
+            self._empirical_prob = self.empirical_prob.copy()
+
+        self._empirical_prob[order - start_value] = prob
@@ -2,11 +2,23 @@
 The curve fitting module
 """
 
+import warnings
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
 import numpy as np
 from scipy import stats  # type: ignore
-from scipy.optimize import curve_fit  # type: ignore
+from scipy.optimize import least_squares  # type: ignore
+
+from pearson3curve import _p3
+from pearson3curve.data import Data
+
+# The skewness step for the central difference of the P-III quantile
+_CS_STEP = 1e-4
 
-from pearson3curve import Curve, Data
+# The tolerances for the termination of the fitting
+_FIT_TOL = 1e-8
 
 
 def get_moments(data: Data) -> tuple[float, float, float]:
@@ -21,54 +33,154 @@ def get_moments(data: Data) -> tuple[float, float, float]:
     Returns
     -------
     tuple[float, float, float]
-        The P-III moments (ex, cv, cs) of the data.
+        The P-III moments (ex, cv, cs) of the data. With fewer than 3 values,
+        they are those of `scipy.stats`, i.e., `nan` for no values, and the
+        skewness is not bias-corrected.
     """
 
-    if len(data.extreme_data) == 0:
-        mean = np.mean(data.data)
-        variance: float = stats.variation(data.data, ddof=1)
-        skewness: float = stats.skew(data.data, bias=False)
+    ed = data.extreme_data
+    od = data.ordinary_data
+
+    if len(ed) == 0:
+        # Successive data, where all the values share the same weight
+        n = len(od)
+        r = 1.0
     else:
-        r = (data.period_length - len(data.extreme_data)) / len(data.ordinary_data)
-
-        mean = (
-            np.sum(data.extreme_data) + r * np.sum(data.ordinary_data)
-        ) / data.period_length
-
-        variance = (
-            np.sqrt(
-                (
-                    np.sum((data.extreme_data - mean) ** 2)
-                    + r * np.sum((data.ordinary_data - mean) ** 2)
-                )
-                / (data.period_length - 1)
-            )
-            / mean
-        )
+        n = data.period_length
+        r = (n - len(ed)) / len(od)
 
-        skewness = (
-            data.period_length
-            * (
-                np.sum((data.extreme_data - mean) ** 3)
-                + r * np.sum((data.ordinary_data - mean) ** 3)
-            )
-            / (
-                (data.period_length - 1)
-                * (data.period_length - 2)
-                * mean**3
-                * variance**3
-            )
+    if n < 3:
+        # Too few values for the bias-corrected skewness, where all the values
+        # share the same weight anyway, so SciPy handles the degenerate cases.
+        return (
+            np.mean(data.data),
+            stats.variation(data.data, ddof=1),
+            stats.skew(data.data, bias=False),
         )
 
+    # The sums of the deviations, and of their squares and cubes, are taken
+    # from a shift, and the central sums are derived from them algebraically
+    # below. The shift is the median rather than the unknown mean, which keeps
+    # the deviations small enough to avoid cancellation. Both partitions are
+    # contiguous views of the data, so the deviations are computed once and
+    # only the reductions are split.
+    shift = data.data[len(data.data) // 2]
+    d = data.data - shift
+    d2 = d * d
+    m = len(ed)
+
+    # The dot products reduce the cubed deviations without another temporary.
+    s1 = d[:m].sum() + r * d[m:].sum()
+    s2 = d2[:m].sum() + r * d2[m:].sum()
+    s3 = d2[:m] @ d[:m] + r * (d2[m:] @ d[m:])
+
+    # The weights sum up to the period length.
+    delta = s1 / n
+    mean = shift + delta
+    s3 = s3 - 3 * delta * s2 + 2 * n * delta**3
+    s2 = s2 - n * delta**2
+
+    # The standard deviation, reused for the skewness instead of
+    # mean**3 * variance**3
+    sd = np.sqrt(s2 / (n - 1))
+
+    variance = sd / mean
+    skewness = n * s3 / ((n - 1) * (n - 2) * sd**3)
+
     return mean, variance, skewness
 
 
+class _P3Fit:
+    """The residuals of the P-III curve model and their Jacobian for fitting
+    the data at fixed probabilities.
+
+    The fitted parameters are (ex, cv, cs), without ex if the mean is fixed,
+    and without cs if it follows the skewness-to-variance ratio. The residuals
+    and the Jacobian are plain methods rather than closures, so they can be
+    pickled.
+
+    The exceedance probabilities do not change during a fit, so their lower
+    tail probabilities are computed once. The quantiles of the last skewness
+    are also kept, since `least_squares` evaluates the Jacobian at the same
+    parameters as the preceding residual evaluation.
+    """
+
+    __slots__ = ("_q", "_values", "_ex", "_sv_ratio", "_cs", "_ppf")
+
+    def __init__(
+        self,
+        prob: np.ndarray,
+        values: np.ndarray,
+        *,
+        ex: float | None = None,
+        sv_ratio: float | None = None,
+    ) -> None:
+        self._q = 1 - prob
+        self._values = values
+        self._ex = ex
+        self._sv_ratio = sv_ratio
+        self._cs: float | None = None
+        self._ppf = np.empty(0)
+
+    def unpack(self, params: Sequence[float]) -> tuple[float, float, float]:
+        """Get the moments (ex, cv, cs) from the fitted parameters."""
+
+        it = iter(params)
+        ex = next(it) if self._ex is None else self._ex
+        cv = next(it)
+        cs = next(it) if self._sv_ratio is None else cv * self._sv_ratio
+
+        return ex, cv, cs
+
+    def ppf(self, cs: float) -> np.ndarray:
+        """The standardized P-III quantiles of the probabilities."""
+
+        if cs != self._cs:
+            self._ppf = _p3.ppf(self._q, cs)
+            self._cs = cs
+
+        return self._ppf
+
+    def residuals(self, params: Sequence[float]) -> np.ndarray:
+        """The differences between the P-III curve values and the data."""
+
+        ex, cv, cs = self.unpack(params)
+
+        return (self.ppf(cs) * cv + 1) * ex - self._values
+
+    def jac(self, params: Sequence[float]) -> np.ndarray:
+        """The Jacobian of `residuals` with respect to the fitted parameters."""
+
+        ex, cv, cs = self.unpack(params)
+
+        q = self.ppf(cs)
+        # The mean and the coefficient of variation enter linearly, and only
+        # the derivative with respect to the skewness needs a central
+        # difference.
+        dq = (_p3.ppf(self._q, cs + _CS_STEP) - _p3.ppf(self._q, cs - _CS_STEP)) / (
+            2 * _CS_STEP
+        )
+
+        d_cv = q * ex
+        d_cs = ex * cv * dq
+        columns = [] if self._ex is not None else [q * cv + 1]
+
+        if self._sv_ratio is None:
+            columns += [d_cv, d_cs]
+        else:
+            # cs = cv * sv_ratio, so the chain rule applies
+            columns += [d_cv + self._sv_ratio * d_cs]
+
+        return np.column_stack(columns)
+
+
 def get_fitted_moments(
     data: Data,
     *,
     sv_ratio: float | None = None,
     fit_ex=True,
     moments: tuple[float, float, float] | None = None,
+    bounds: tuple[tuple[float, float, float], tuple[float, float, float]] | None = None,
 ) -> tuple[float, float, float]:
     """Get the fitted P-III distribution moments (mean, coefficient of
     variation, and skewness) of the data.
@@ -86,12 +198,24 @@ def get_fitted_moments(
         not be fitted.
     moments : tuple[float, float, float] | None, optional
         The moments (ex, cv, cs) of the data. If `None`, the moments will be
-        calculated from the data.
+        calculated from the data. They are the initial guess of the fitting,
+        so the fitted moments of a similar fit, e.g., with a neighboring
+        `sv_ratio`, can be passed to warm-start it.
+    bounds : tuple[tuple[float, float, float], tuple[float, float, float]] | None, optional
+        The lower and upper bounds of the moments (ex, cv, cs), by default
+        `None`, which means the moments are not bounded. The bounds of the
+        moments that are not fitted are ignored. A `RuntimeWarning` is issued
+        if any fitted moment ends up on its bound.
 
     Returns
     -------
     tuple[float, float, float]
         The fitted P-III moments (ex, cv, cs) of the data.
+
+    Raises
+    ------
+    RuntimeError
+        If the fitting fails to converge.
     """
 
     if moments is None:
@@ -99,51 +223,169 @@ def get_fitted_moments(
     else:
         m_ex, m_cv, m_cs = moments
 
-    if sv_ratio is None:
-        if fit_ex:
-            popt = curve_fit(
-                lambda prob, ex, cv, cs: Curve(ex, cv, cs).get_value_from_prob(prob),
-                data.empirical_prob,
-                data.data,
-                p0=[m_ex, m_cv, m_cs],
-            )[0]
+    fit = _P3Fit(
+        data.empirical_prob,
+        data.data,
+        ex=None if fit_ex else m_ex,
+        sv_ratio=sv_ratio,
+    )
 
-            [ex, cv, cs] = popt
-        else:
-            popt = curve_fit(
-                lambda prob, cv, cs: Curve(m_ex, cv, cs).get_value_from_prob(prob),
-                data.empirical_prob,
-                data.data,
-                p0=[m_cv, m_cs],
-            )[0]
-
-            ex = m_ex
-            [cv, cs] = popt
+    # Levenberg-Marquardt is the fastest for the unbounded fit, while the
+    # bounded fit needs the trust region reflective method.
+    if bounds is None:
+        bounds = ((-np.inf,) * 3, (np.inf,) * 3)
+        method = "lm"
     else:
-        if fit_ex:
-            popt = curve_fit(
-                lambda prob, ex, cv: Curve(ex, cv, cv * sv_ratio).get_value_from_prob(
-                    prob
-                ),
-                data.empirical_prob,
-                data.data,
-                p0=[m_ex, m_cv],
-            )[0]
-
-            [ex, cv] = popt
-            cs = cv * sv_ratio
-        else:
-            popt = curve_fit(
-                lambda prob, cv: Curve(m_ex, cv, cv * sv_ratio).get_value_from_prob(
-                    prob
-                ),
-                data.empirical_prob,
-                data.data,
-                p0=[m_cv],
-            )[0]
-
-            ex = m_ex
-            [cv] = popt
-            cs = cv * sv_ratio
+        method = "trf"
+
+    fitted = (fit_ex, True, sv_ratio is None)
+    p0, lower, upper = (
+        np.array([v for v, f in zip(values, fitted) if f], dtype=np.float64)
+        for values in ((m_ex, m_cv, m_cs), *bounds)
+    )
+
+    # Scaling the parameters by the Jacobian copes with their very different
+    # magnitudes, e.g., ex in thousands and cs around 1.
+    res = least_squares(
+        fit.residuals,
+        # The initial moments may fall out of the bounds.
+        np.clip(p0, lower, upper),
+        jac=fit.jac,
+        bounds=(lower, upper),
+        method=method,
+        x_scale="jac",
+        xtol=_FIT_TOL,
+        ftol=_FIT_TOL,
+    )
+
+    # The same as `curve_fit`, which used to fit the moments
+    if not res.success:
+        raise RuntimeError(f"Optimal parameters not found: {res.message}")
+
+    if res.active_mask.any():
+        warnings.warn(
+            "Some of the fitted moments are on their bounds.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    popt = res.x
+    ex, cv, cs = fit.unpack(popt)
 
     return ex, cv, cs
+
+
+def get_fitted_moments_batch(
+    datas: Sequence[Data],
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    **kwargs,
+) -> np.ndarray:
+    """Get the fitted P-III distribution moments (mean, coefficient of
+    variation, and skewness) of several data in parallel processes.
+
+    Processes are used because most of a fit runs in Python and holds the GIL.
+    The plain moments are a few NumPy reductions, which are cheap enough to be
+    mapped over the data directly, or in a `ThreadPoolExecutor` for large data.
+
+    Where new processes are spawned rather than forked, i.e., by default on
+    Windows and macOS, and on Linux since Python 3.14, the worker processes
+    import the main module. A script calling this function must then guard
+    the call with `if __name__ == "__main__":`.
+
+    Parameters
+    ----------
+    datas : Sequence[Data]
+        The P-III distributed data.
+    max_workers : int | None, optional
+        The maximum number of worker processes, by default None, which means
+        the number of processors on the machine.
+    executor : Executor | None, optional
+        The executor to fit the data in, by default None, which means a new
+        `ProcessPoolExecutor` with `max_workers` is created and shut down for
+        this call. A given executor is not shut down, and `max_workers` is
+        ignored.
+    **kwargs
+        Additional keyword arguments to be passed to the `get_fitted_moments`
+        function for every data.
+
+    Returns
+    -------
+    np.ndarray
+        The fitted P-III moments (ex, cv, cs), with one row for each data.
+    """
+
+    fit = partial(get_fitted_moments, **kwargs)
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            moments = list(executor.map(fit, datas))
+    else:
+        moments = list(executor.map(fit, datas))
+
+    return np.array(moments, dtype=np.float64).reshape(-1, 3)
+
+
+def get_fitted_moments_bootstrap(
+    data: Data,
+    *,
+    n_boot=1000,
+    seed: int | None = None,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    **kwargs,
+) -> np.ndarray:
+    """Get the fitted P-III distribution moments (mean, coefficient of
+    variation, and skewness) of bootstrap resamples of the data, e.g., for
+    their percentile confidence intervals.
+
+    The extreme data and the ordinary data are resampled separately with
+    replacement, keeping their lengths and the survey period length. The
+    resamples use the default empirical probabilities, and are fitted in
+    parallel processes by `get_fitted_moments_batch`, so a script calling
+    this function must guard the call with `if __name__ == "__main__":` as
+    well, where new processes are spawned rather than forked.
+
+    Parameters
+    ----------
+    data : Data
+        The P-III distributed data.
+    n_boot : int, optional
+        The number of bootstrap resamples, by default 1000.
+    seed : int | None, optional
+        The seed of the random number generator, by default None.
+    max_workers : int | None, optional
+        The maximum number of worker processes, by default None, which means
+        the number of processors on the machine.
+    executor : Executor | None, optional
+        The executor to fit the resamples in, by default None. See
+        `get_fitted_moments_batch`.
+    **kwargs
+        Additional keyword arguments to be passed to the `get_fitted_moments`
+        function for every resample.
+
+    Returns
+    -------
+    np.ndarray
+        The fitted P-III moments (ex, cv, cs), with one row for each resample.
+    """
+
+    ed = data.extreme_data
+    od = data.ordinary_data
+
+    # All the resamples are drawn at once, one row for each.
+    rng = np.random.default_rng(seed)
+    extreme_samples = ed[rng.integers(len(ed), size=(n_boot, len(ed)))]
+    ordinary_samples = od[rng.integers(len(od), size=(n_boot, len(od)))]
+
+    datas = []
+    for extreme_sample, ordinary_sample in zip(extreme_samples, ordinary_samples):
+        d = Data(ordinary_sample)
+        if len(ed):
+            d.set_history_data(extreme_sample, data.period_length, extreme_num=len(ed))
+        datas.append(d)
+
+    return get_fitted_moments_batch(
+        datas, max_workers=max_workers, executor=executor, **kwargs
+    )
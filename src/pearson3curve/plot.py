@@ -1,11 +1,14 @@
 """The module for plotting the Pearson Type III distribution curve."""
 
+import math
+from functools import lru_cache
 from typing import Any
 
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
-import probscale  # type: ignore # pylint: disable=unused-import
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 from pearson3curve.curve import Curve
 from pearson3curve.data import Data  # type: ignore # pylint: disable=unused-import
@@ -14,18 +17,42 @@ from pearson3curve.data import Data  # type: ignore # pylint: disable=unused-imp
 _xlim: list[float] = [1, 99]
 
 
-# Initialize the figure and axis
-_fig = plt.figure(1)
-_ax = _fig.add_subplot()
+@lru_cache(maxsize=1)
+def _get_figure_axes() -> tuple[Figure, Axes]:
+    """Get the figure and axis, which are initialized on the first use, so
+    importing the module does not create a figure.
+    """
+
+    # Registers the probability scale
+    import probscale  # type: ignore # pylint: disable=import-outside-toplevel,unused-import
+
+    # Initialize the figure and axis. The axis is kept, since the figure may
+    # already have other axes if it was created before the first use.
+    fig = plt.figure(1)
+    ax = fig.add_subplot()
+
+    # Some pre-settings
+    fig.set_layout_engine("constrained")
+    ax.set_xscale("prob")
+    ax.set_xlim(*_xlim)
+    ax.grid(True)
+
+    ax.set_xlabel("Frequency (%)")
+    ax.set_ylabel("Flow (m³/s)")
+
+    return fig, ax
 
-# Some pre-settings
-_fig.set_layout_engine("constrained")
-_ax.set_xscale("prob")
-_ax.set_xlim(*_xlim)
-_ax.grid(True)
 
-_ax.set_xlabel("Frequency (%)")
-_ax.set_ylabel("Flow (m³/s)")
+def _get_figure() -> Figure:
+    """Get the figure."""
+
+    return _get_figure_axes()[0]
+
+
+def _get_axes() -> Axes:
+    """Get the axis of the figure."""
+
+    return _get_figure_axes()[1]
 
 
 def set_figsize(width: float, height: float) -> None:
@@ -39,7 +66,7 @@ def set_figsize(width: float, height: float) -> None:
         The height of the figure in inches.
     """
 
-    _fig.set_size_inches(width, height)
+    _get_figure().set_size_inches(width, height)
 
 
 def set_font(font: str) -> None:
@@ -66,7 +93,7 @@ def set_title(title: str, **kwargs) -> None:
         `matplotlib.axes.Axes.set_title` method.
     """
 
-    _ax.set_title(title, **kwargs)
+    _get_axes().set_title(title, **kwargs)
 
 
 def set_xlim(left: float, right: float, **kwargs) -> None:
@@ -83,7 +110,7 @@ def set_xlim(left: float, right: float, **kwargs) -> None:
         `matplotlib.axes.Axes.set_xlim` method.
     """
 
-    _ax.set_xlim(left, right, **kwargs)
+    _get_axes().set_xlim(left, right, **kwargs)
     _xlim[:] = [left, right]
 
 
@@ -99,7 +126,7 @@ def set_xlabel(label: str, **kwargs) -> None:
         `matplotlib.axes.Axes.set_xlabel` method.
     """
 
-    _ax.set_xlabel(label, **kwargs)
+    _get_axes().set_xlabel(label, **kwargs)
 
 
 def set_ylabel(label: str, **kwargs) -> None:
@@ -114,7 +141,7 @@ def set_ylabel(label: str, **kwargs) -> None:
         `matplotlib.axes.Axes.set_ylabel` method.
     """
 
-    _ax.set_ylabel(label, **kwargs)
+    _get_axes().set_ylabel(label, **kwargs)
 
 
 def grid(visible: bool, **kwargs) -> None:
@@ -129,7 +156,7 @@ def grid(visible: bool, **kwargs) -> None:
         `matplotlib.axes.Axes.grid` method.
     """
 
-    _ax.grid(visible, **kwargs)
+    _get_axes().grid(visible, **kwargs)
 
 
 def legend(**kwargs) -> None:
@@ -142,7 +169,7 @@ def legend(**kwargs) -> None:
         `matplotlib.axes.Axes.legend` method.
     """
 
-    _ax.legend(**kwargs)
+    _get_axes().legend(**kwargs)
 
 
 def scatter(
@@ -182,13 +209,22 @@ def scatter(
         if prob > 1:
             return 1
 
-        return 10 ** np.ceil(np.log10(prob * 100) - 1)
+        # The logarithm of 0 is out of the domain of `math.log10`.
+        if prob <= 0:
+            return 0.0
+
+        # A scalar, so plain Python math is enough.
+        return 10.0 ** (math.ceil(math.log10(prob * 100)) - 1)
 
     set_xlim(
         get_prob_lim(data.empirical_prob[0]),
         100 - get_prob_lim(100 - data.empirical_prob[-1]),
     )
 
+    # The probabilities in percent, split between both kinds of the data
+    prob = data.empirical_prob * 100
+    ax = _get_axes()
+
     if extreme_kwargs is None:
         extreme_kwargs = {
             "marker": "x",
@@ -208,12 +244,38 @@ def scatter(
         extreme_kwargs.update(kwargs)
         ordinary_kwargs.update(kwargs)
 
-    if len(data.extreme_data):
+    if l := len(data.extreme_data):
         plt.rcParams["scatter.marker"] = "x"
-        _ax.scatter(data.extreme_prob * 100, data.extreme_data, **extreme_kwargs)
+        ax.scatter(prob[:l], data.extreme_data, **extreme_kwargs)
 
     plt.rcParams["scatter.marker"] = "o"
-    _ax.scatter(data.ordinary_prob * 100, data.ordinary_data, **ordinary_kwargs)
+    ax.scatter(prob[l:], data.ordinary_data, **ordinary_kwargs)
+
+
+@lru_cache(maxsize=16)
+def _get_prob_space(left: float, right: float) -> np.ndarray:
+    """Get the probabilities (%) to plot the curves at, which are denser near
+    the limits. They only depend on the x-axis limits, so they are cached and
+    shared by all the curves, and must not be modified.
+    """
+
+    def fill_space(out: np.ndarray, lim: float) -> None:
+        if lim < 1:
+            out[:200] = np.logspace(np.log10(lim), 0, num=200, endpoint=False)
+            out[200:] = np.logspace(0, 1, num=150, endpoint=False)
+        else:
+            out[:] = np.logspace(np.log10(lim), 1, num=350, endpoint=False)
+
+    # The grid is filled in place, with the right tail mirrored from the left.
+    x = np.empty(1000)
+    fill_space(x[:350], left)
+    x[350:650] = np.linspace(10, 90, num=300)
+    x2 = x[650:][::-1]
+    fill_space(x2, 100 - right)
+    np.subtract(100, x2, out=x2)
+    x.flags.writeable = False
+
+    return x
 
 
 def plot(
@@ -248,29 +310,16 @@ def plot(
         {"label": label, "color": color, "linestyle": linestyle, "linewidth": linewidth}
     )
 
-    def create_space(lim: float) -> np.ndarray:
-        if lim < 1:
-            return np.concatenate(
-                [
-                    np.logspace(np.log10(lim), np.log10(1), num=200, endpoint=False),
-                    np.logspace(np.log10(1), np.log10(10), num=150, endpoint=False),
-                ]
-            )
-
-        return np.logspace(np.log10(lim), np.log10(10), num=350, endpoint=False)
-
-    x1 = create_space(_xlim[0])
-    x2 = (100 - create_space(100 - _xlim[1]))[::-1]
-    x = np.concatenate([x1, np.linspace(10, 90, num=300), x2])
-    y = [curve.get_value_from_prob(prob / 100) for prob in x]
+    x = _get_prob_space(*_xlim)
+    y = curve.get_value_from_prob(x / 100)
 
-    _ax.plot(x, y, **kwargs)
+    _get_axes().plot(x, y, **kwargs)
 
 
 def show() -> None:
     """Display the plot."""
 
-    _fig.show()
+    _get_figure().show()
 
 
 def save(file_name: str, *, transparent=True, dpi=300, **kwargs) -> None:
@@ -292,4 +341,4 @@ def save(file_name: str, *, transparent=True, dpi=300, **kwargs) -> None:
 
     kwargs.update({"transparent": transparent, "dpi": dpi})
 
-    _fig.savefig(file_name, **kwargs)
+    _get_figure().savefig(file_name, **kwargs)
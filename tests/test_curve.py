@@ -1,7 +1,9 @@
 import math
+
+import numpy as np
 import pytest
 
-from pearson3curve import Curve
+from pearson3curve import Curve, get_curve_values
 
 
 def test_curve():
@@ -16,3 +18,47 @@ def test_curve():
     assert curve.get_prob_from_value(50) == pytest.approx(0.60653066)
     assert curve.get_prob_from_value(100) == pytest.approx(0.36787944)
     assert curve.get_prob_from_value(200) == pytest.approx(0.13533528)
+
+
+def test_curve_array():
+    curve = Curve(100, 1, 2)
+
+    probs = np.array([0.01, 0.5, 0.99])
+    values = curve.get_value_from_prob(probs)
+    assert isinstance(values, np.ndarray)
+    assert values == pytest.approx([460.517019, 69.314718, 1.005034])
+
+    values = np.array([50, 100, 200])
+    assert curve.get_prob_from_value(values) == pytest.approx(
+        [0.60653066, 0.36787944, 0.13533528]
+    )
+
+
+def test_curve_set_cs():
+    curve = Curve(100, 1, 1)
+    curve.cs = 2
+
+    assert curve.get_value_from_prob(0.01) == pytest.approx(460.517019)
+    assert curve.get_prob_from_value(100) == pytest.approx(0.36787944)
+
+
+def test_curve_array_round_trip():
+    curve = Curve(100, 0.5, 1.5)
+
+    probs = np.linspace(0.01, 0.99, 50)
+    values = curve.get_value_from_prob(probs)
+    assert curve.get_prob_from_value(values) == pytest.approx(probs)
+
+
+def test_get_curve_values():
+    ex = np.array([100, 50, 80])
+    cv = np.array([1, 0.5, 0.3])
+    cs = np.array([2, 0, -0.5])
+    probs = np.array([0.01, 0.5, 0.99])
+
+    values = get_curve_values(ex, cv, cs, probs)
+    assert values.shape == (3, 3)
+
+    for i in range(3):
+        curve = Curve(ex[i], cv[i], cs[i])
+        assert values[i] == pytest.approx(curve.get_value_from_prob(probs))
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pearson3curve import Data
@@ -60,6 +61,9 @@ def test_set_empirical_prob(d: Data) -> None:
     with pytest.raises(ValueError):
         d.set_empirical_prob([0.1, 0.2, 2])
 
+    with pytest.raises(ValueError):
+        d.set_empirical_prob(np.array([0.1, -0.2, 0.3]))
+
 
 def test_set_empirical_prob_by_no(d: Data) -> None:
     d.set_empirical_prob_by_order(2, 0.4)
@@ -94,3 +98,76 @@ def test_set_empirical_prob_by_no_with_history_data(d: Data) -> None:
     assert d2.empirical_prob == pytest.approx([0.05, 0.2, 0.4, 0.6, 0.8])
     assert d2.extreme_prob == pytest.approx([0.05, 0.2])
     assert d2.ordinary_prob == pytest.approx([0.4, 0.6, 0.8])
+
+
+def test_empirical_prob_cache(d: Data) -> None:
+    assert d.empirical_prob is d.empirical_prob
+
+    with pytest.raises(ValueError):
+        d.empirical_prob[0] = 0.5
+
+    d.set_history_data([10], 9)
+    assert d.empirical_prob == pytest.approx([0.1, 0.325, 0.55, 0.775])
+
+
+def test_set_empirical_prob_by_order_keeps_input(d: Data) -> None:
+    empirical_prob = np.array([0.1, 0.2, 0.3])
+    d.set_empirical_prob(empirical_prob)
+    d.set_empirical_prob_by_order(1, 0.05)
+
+    assert d.empirical_prob == pytest.approx([0.05, 0.2, 0.3])
+    assert empirical_prob == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_set_empirical_prob_read_only(d: Data) -> None:
+    d.set_empirical_prob([0.1, 0.2, 0.3])
+
+    with pytest.raises(ValueError):
+        d.empirical_prob[0] = 2
+
+    with pytest.raises(ValueError):
+        d.extreme_prob[0] = 2
+
+    d.set_empirical_prob_by_order(2, 0.25)
+    assert d.empirical_prob == pytest.approx([0.1, 0.25, 0.3])
+
+
+def test_data_dtype(d: Data) -> None:
+    assert d.data.dtype == np.float64
+
+    d.set_history_data([6], 6)
+    assert d.data.dtype == np.float64
+
+
+def test_set_history_data_merge() -> None:
+    d = Data([5, 1, 3])
+    d.set_history_data([4, 0, 6], 7, extreme_num=4)
+    assert d.data == pytest.approx([6, 5, 4, 3, 1, 0])
+    assert d.extreme_data == pytest.approx([6, 5, 4, 3])
+    assert d.ordinary_data == pytest.approx([1, 0])
+
+
+def test_data_read_only(d: Data) -> None:
+    with pytest.raises(ValueError):
+        d.data[0] = 0
+
+    d.set_history_data([6], 6)
+    assert np.shares_memory(d.extreme_data, d.data)
+    assert np.shares_memory(d.ordinary_data, d.data)
+
+    with pytest.raises(ValueError):
+        d.ordinary_data[0] = 0
+
+
+def test_data_contiguous(d: Data) -> None:
+    assert d.data.flags.c_contiguous
+
+    d.set_history_data([2.5, 0, 6], 8)
+    assert d.data == pytest.approx([6, 3, 2.5, 2, 1, 0])
+    assert d.data.flags.c_contiguous
+
+
+def test_set_history_data_resets_empirical_prob(d: Data) -> None:
+    d.set_empirical_prob([0.1, 0.2, 0.3])
+    d.set_history_data([10], 9)
+    assert d.empirical_prob == pytest.approx([0.1, 0.325, 0.55, 0.775])
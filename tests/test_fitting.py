@@ -1,7 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import numpy as np
 import pytest
 
-from pearson3curve import Data, get_moments
+from pearson3curve import fitting
+from pearson3curve import (
+    Curve,
+    Data,
+    get_fitted_moments,
+    get_fitted_moments_batch,
+    get_fitted_moments_bootstrap,
+    get_moments,
+)
 
 
 def test_successive_momentum_params():
@@ -20,3 +31,118 @@ def test_successive_momentum_params():
     sk = n * np.sum((d.data - ex) ** 3) / ((n - 1) * (n - 2) * ex**3 * cv**3)
 
     assert sk == pytest.approx(cs)
+
+
+def test_nonsuccessive_momentum_params():
+    d = Data(np.random.rand(30).tolist())
+    d.set_history_data([3, 2.5], 100, extreme_num=4)
+
+    ex, cv, cs = get_moments(d)
+
+    n = d.period_length
+    w = np.where(np.arange(len(d.data)) < 4, 1, (n - 4) / (len(d.data) - 4))
+
+    e = np.sum(w * d.data) / n
+    assert ex == pytest.approx(e)
+
+    s = np.sqrt(np.sum(w * (d.data - ex) ** 2) / (n - 1))
+    v = s / ex
+    assert cv == pytest.approx(v)
+
+    sk = n * np.sum(w * (d.data - ex) ** 3) / ((n - 1) * (n - 2) * ex**3 * cv**3)
+
+    assert sk == pytest.approx(cs)
+
+
+def test_few_momentum_params():
+    assert get_moments(Data([1, 2])) == pytest.approx((1.5, np.sqrt(2) / 3, 0))
+
+    with pytest.warns(RuntimeWarning):
+        assert np.isnan(get_moments(Data([]))).all()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"fit_ex": False}, {"sv_ratio": 3}, {"sv_ratio": 3, "fit_ex": False}]
+)
+def test_fitted_moments(kwargs):
+    curve = Curve(1000, 0.5, 1.5)
+    prob = np.arange(1, 51) / 51
+    d = Data(curve.get_value_from_prob(prob))
+
+    ex, cv, cs = get_fitted_moments(d, moments=(1000, 0.4, 1.2), **kwargs)
+
+    assert ex == pytest.approx(1000)
+    assert cv == pytest.approx(0.5)
+    assert cs == pytest.approx(1.5)
+
+
+def test_fitted_moments_negative_mean():
+    curve = Curve(-1000, -0.5, 1.5)
+    d = Data(curve.get_value_from_prob(np.arange(1, 51) / 51))
+
+    ex, cv, cs = get_fitted_moments(d, moments=(-900, -0.4, 1.2))
+
+    assert ex == pytest.approx(-1000)
+    assert cv == pytest.approx(-0.5)
+    assert cs == pytest.approx(1.5)
+
+
+def test_fitted_moments_bounds():
+    curve = Curve(1000, 0.5, 1.5)
+    d = Data(curve.get_value_from_prob(np.arange(1, 51) / 51))
+
+    with pytest.warns(RuntimeWarning):
+        ex, cv, cs = get_fitted_moments(d, bounds=((0, 0, -1), (np.inf, np.inf, 1)))
+
+    assert cs == pytest.approx(1)
+
+
+def test_fitted_moments_failure(monkeypatch):
+    d = Data(Curve(1000, 0.5, 1.5).get_value_from_prob(np.arange(1, 51) / 51))
+
+    monkeypatch.setattr(
+        fitting,
+        "least_squares",
+        partial(fitting.least_squares, max_nfev=2),
+    )
+
+    with pytest.raises(RuntimeError):
+        get_fitted_moments(d, moments=(500, 0.2, 0.5))
+
+
+def test_fitted_moments_batch():
+    prob = np.arange(1, 51) / 51
+    datas = [
+        Data(Curve(ex, 0.5, 1.5).get_value_from_prob(prob)) for ex in (500, 1000, 2000)
+    ]
+
+    moments = get_fitted_moments_batch(datas, max_workers=2, sv_ratio=3)
+    assert moments.shape == (3, 3)
+
+    for d, m in zip(datas, moments):
+        assert m == pytest.approx(get_fitted_moments(d, sv_ratio=3))
+
+
+def test_fitted_moments_batch_executor():
+    prob = np.arange(1, 51) / 51
+    datas = [Data(Curve(ex, 0.5, 1.5).get_value_from_prob(prob)) for ex in (500, 1000)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        moments = get_fitted_moments_batch(datas, executor=executor)
+        # The given executor is not shut down.
+        assert executor.submit(len, datas).result() == 2
+
+    assert moments[:, 0] == pytest.approx([500, 1000])
+
+
+def test_fitted_moments_bootstrap():
+    curve = Curve(1000, 0.5, 1.5)
+    d = Data(curve.get_value_from_prob(np.arange(3, 31) / 31))
+    d.set_history_data(curve.get_value_from_prob([1 / 31, 2 / 31]), 30)
+
+    moments = get_fitted_moments_bootstrap(d, n_boot=8, seed=0, max_workers=2)
+    assert moments.shape == (8, 3)
+    assert np.median(moments[:, 0]) == pytest.approx(1000, rel=0.2)
+
+    again = get_fitted_moments_bootstrap(d, n_boot=8, seed=0, max_workers=2)
+    assert again == pytest.approx(moments)
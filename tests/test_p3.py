@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from scipy.stats import pearson3  # type: ignore
+
+from pearson3curve import _p3
+
+
+@pytest.mark.parametrize("cs", [-3, -1, -1e-6, 0, 1e-6, 0.3, 2, 5])
+def test_p3(cs: float) -> None:
+    q = np.linspace(0.001, 0.999, 101)
+    assert _p3.ppf(q, cs) == pytest.approx(pearson3.ppf(q, cs))
+
+    x = np.linspace(-10, 10, 199)
+    assert _p3.cdf(x, cs) == pytest.approx(pearson3.cdf(x, cs), abs=1e-12)
+
+    assert np.isnan(_p3.ppf(2, cs))
+    assert _p3.ppf([0, 1], cs) == pytest.approx(pearson3.ppf([0, 1], cs))
+    assert _p3.ppf_scalar(0, cs) == pearson3.ppf(0, cs)
+    assert _p3.ppf_scalar(1, cs) == pearson3.ppf(1, cs)
+
+
+def test_p3_broadcast() -> None:
+    q = np.linspace(0.01, 0.99, 50)
+    cs = np.array([[-2], [0], [1], [3]])
+
+    assert _p3.ppf(q, cs).shape == (4, 50)
+    assert _p3.ppf(q, cs) == pytest.approx(pearson3.ppf(q, cs))
+    assert _p3.ppf([0, 1], cs) == pytest.approx(pearson3.ppf([0, 1], cs))
+
+    x = _p3.ppf(q, cs)
+    assert _p3.cdf(x, cs) == pytest.approx(np.broadcast_to(q, (4, 50)))
+
+
+@pytest.mark.parametrize("cs", [-3, -1e-6, 0, 2])
+def test_p3_scalar(cs: float) -> None:
+    for q in [0.001, 0.3, 0.5, 0.999]:
+        assert _p3.ppf_scalar(q, cs) == pytest.approx(_p3.ppf(q, cs))
+
+    for x in [-3, -0.5, 0, 1.5, 6]:
+        assert _p3.cdf_scalar(x, cs) == pytest.approx(_p3.cdf(x, cs))